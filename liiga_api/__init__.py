@@ -1,6 +1,6 @@
 
 from .exceptions import LiigaAPIError
-from .base import Endpoint
+from .base import Endpoint, enable_cache, disable_cache, clear_cache
 
 
 from .endpoints.players import (
@@ -27,6 +27,7 @@ from .endpoints.games import (
     GamesResults,
     GameGoalEvents,
     GamesGoalEvents,
+    GamesBundle,
     GamesSimpleResults,
 
     GameInfo,
@@ -59,6 +60,9 @@ __all__ = [
     # Base classes and exceptions
     "LiigaAPIError",
     "Endpoint",
+    "enable_cache",
+    "disable_cache",
+    "clear_cache",
     
     # Player endpoints
     "PlayerGameLog",
@@ -82,6 +86,7 @@ __all__ = [
     "GamesResults",
     "GameGoalEvents",
     "GamesGoalEvents",
+    "GamesBundle",
     "GamesSimpleResults",
     "GameInfo",
     "GamePlayers",
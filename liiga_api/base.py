@@ -1,11 +1,103 @@
-import functools
+import threading
+import time
+import weakref
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import json
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, Iterator, Literal
 from liiga_api.utils import flatten_dict, ResponseParser
 from liiga_api.exceptions import LiigaAPIError
 
+# orjson is an optional speedup for decoding large responses, falls back to the standard library
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ijson is optional, needed only for endpoints that stream their response
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Accept-Encoding is left to requests, which advertises br and zstd when their decoders are installed
+_DEFAULT_HEADERS = {"Accept": "application/json"}
+
+
+def _configure_session(session: requests.Session) -> requests.Session:
+    """Mounts a connection pool large enough for fetch_many and sets the default headers."""
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(_DEFAULT_HEADERS)
+    return session
+
+
+# Session used for all requests so connections are kept alive between endpoints,
+# replaced by a requests_cache session with enable_cache() or by Endpoint.set_session()
+_session = _configure_session(requests.Session())
+
+
+def enable_cache(cache_name: str = "liiga_cache", expire_after: int = 3600, **kwargs) -> None:
+    """Caches responses on disk so repeated queries (e.g. finished seasons) skip the network.
+    Requires the optional requests-cache package. expire_after is in seconds, -1 never expires,
+    extra keyword arguments (e.g. urls_expire_after) are passed on to requests_cache.CachedSession."""
+    try:
+        import requests_cache
+    except ImportError as e:
+        raise LiigaAPIError("enable_cache requires the optional requests-cache package.") from e
+    global _session
+    _session = _configure_session(
+        requests_cache.CachedSession(cache_name, backend="sqlite", expire_after=expire_after, **kwargs))
+
+
+def disable_cache() -> None:
+    """Goes back to uncached requests."""
+    global _session
+    _session = _configure_session(requests.Session())
+
+
+def _get_json(url: str, params: tuple = ()) -> Any:
+    """Performs a GET request and decodes the JSON body."""
+    response = _session.get(url, params=dict(params))
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+# Responses for endpoints with _SHARED_RESPONSE = True, keyed by url and params.
+# Entries expire after _SHARED_TTL seconds so current seasons and live games are fetched again.
+_SHARED_TTL: float = 30.0
+_SHARED_MAXSIZE: int = 256
+_shared_responses: Dict[tuple, tuple] = {}
+_shared_lock = threading.Lock()
+
+
+def _get_json_shared(url: str, params: tuple = ()) -> Any:
+    """Same as _get_json, reusing a response fetched for the same url less than _SHARED_TTL seconds ago."""
+    key = (url, params)
+    with _shared_lock:
+        hit = _shared_responses.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _SHARED_TTL:
+        return hit[1]
+    response = _get_json(url, params)
+    with _shared_lock:
+        _shared_responses.pop(key, None)
+        _shared_responses[key] = (time.monotonic(), response)
+        if len(_shared_responses) > _SHARED_MAXSIZE:
+            # Insertion ordered, the first entry is the oldest
+            del _shared_responses[next(iter(_shared_responses))]
+    return response
+
+
+def clear_cache() -> None:
+    """Drops the responses shared in memory between endpoints, the next access fetches them again.
+    The disk cache of enable_cache() is not affected."""
+    with _shared_lock:
+        _shared_responses.clear()
+
 
 class Endpoint:
     """Base class for LiigaAPI endpoints.
@@ -21,30 +113,156 @@ class Endpoint:
         data: The parsed data, ready for use. Lazy loaded when users wants to access data
     """
 
+    # No per-instance __dict__ unless a subclass leaves out __slots__, response and data are stored in slots
+    __slots__ = ("endpoint_name", "url_str", "params", "_response", "_data", "__weakref__")
+
     BASE_URL: str = "https://liiga.fi/api/v2"
-    
-    
+
+    # Columns converted to compact dtypes by get_data_frame(optimize_dtypes=True)
+    _CATEGORICAL_COLS: tuple = ()
+    _INT32_COLS: tuple = ()
+    _FLOAT32_COLS: tuple = ()
+
+    # Endpoints reading the same url share a response fetched in the last _SHARED_TTL seconds,
+    # their parsers must not mutate the response
+    _SHARED_RESPONSE: bool = False
+
+    # Live instances keyed by class and constructor arguments, see instance()
+    _instances: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+
     def __init__(self, endpoint_name: str, url_str: str, **params: str):
         self.endpoint_name: str = endpoint_name
         self.url_str: str = url_str
         self.params: Dict = params
 
 
-    @functools.cached_property
+    @classmethod
+    def instance(cls, *args, **kwargs) -> "Endpoint":
+        """Returns the live endpoint earlier built by instance() with the same arguments, or builds a new one,
+        so its response and parsed data are reused. Instances are held weakly, unhashable arguments are not deduplicated."""
+        # Argument types are part of the key so e.g. 2024 and 2024.0 (equal, different urls) stay apart
+        key = (cls, tuple((type(a), a) for a in args), tuple(sorted((k, type(v), v) for k, v in kwargs.items())))
+        try:
+            endpoint = Endpoint._instances.get(key)
+        except TypeError:
+            return cls(*args, **kwargs)
+        if endpoint is None:
+            endpoint = cls(*args, **kwargs)
+            Endpoint._instances[key] = endpoint
+        return endpoint
+
+    @staticmethod
+    def set_session(session: requests.Session) -> None:
+        """Uses the given session (e.g. with custom headers, proxies or retries) for all requests.
+        The session is used as is, the default pool and headers are not applied."""
+        global _session
+        _session = session
+
+    @classmethod
+    def fetch_many(cls, params_list: list, max_workers: int = 8) -> list:
+        """Builds one endpoint per entry of params_list and fetches their responses concurrently.
+        Entries are tuples of positional arguments or dicts of keyword arguments.
+        Returns the endpoints in the same order with responses loaded, e.g.
+        TeamShots.fetch_many([(s, s, "regularseason") for s in range(2015, 2025)])
+        Requests share the pooled module session, parse with .data or get_data_frame() afterwards."""
+        endpoints = [cls(**p) if isinstance(p, dict) else cls(*p) for p in params_list]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Requests release the GIL while waiting on the network, so fetches overlap
+            list(executor.map(lambda endpoint: endpoint.response, endpoints))
+        return endpoints
+
+    @property
     def response(self) -> Dict:
         """Fetches and caches the API response."""
+        try:
+            return self._response
+        except AttributeError:
+            pass
+        try:
+            self._response = self._fetch()
+        except requests.RequestException as e:
+            raise LiigaAPIError(f"Error fetching {self.endpoint_name}: {e}") from e
+        except ValueError as e:
+            raise LiigaAPIError(f"Error decoding {self.endpoint_name} response: {e}") from e
+        return self._response
+
+    @response.setter
+    def response(self, value: Any) -> None:
+        # e.g. a response fetched elsewhere or loaded from a file, parsed data already cached is kept
+        self._response = value
+
+    @response.deleter
+    def response(self) -> None:
+        try:
+            del self._response
+        except AttributeError:
+            pass
+
+    def _response_field(self, key: str) -> Any:
+        """Returns response[key], raises LiigaAPIError when the response is not a dict with that key."""
+        response = self.response
+        try:
+            return response[key]
+        except (TypeError, KeyError, IndexError) as e:
+            raise LiigaAPIError(f"Unexpected response for {self.endpoint_name}: no {key!r} in {type(response)}") from e
+
+    def _stream_items(self, prefix: str) -> Iterator:
+        """Yields the items under prefix (e.g. "item" for a top level list) while the response downloads,
+        without holding the whole decoded response in memory. Requires ijson.
+        Raises LiigaAPIError when the list holding the items is missing, like _response_field."""
+        if ijson is None:
+            raise LiigaAPIError(f"Streaming {self.endpoint_name} requires the optional ijson package.")
+        container = prefix[:-len(".item")] if prefix.endswith(".item") else ""
+        found = False
+
+        def watch(events: Iterator) -> Iterator:
+            # Passes the parse events on to ijson.items, noting whether the list itself was seen
+            nonlocal found
+            for event in events:
+                if not found and event[0] == container and event[1] == "start_array":
+                    found = True
+                yield event
+
         try:
             url = f"{self.BASE_URL}/{self.url_str}"
-            response = requests.get(url, params=self.params)
-            response.raise_for_status()
-            return response.json()
+            with _session.get(url, params=self.params, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield from ijson.items(watch(ijson.parse(response.raw, use_float=True)), prefix)
         except requests.RequestException as e:
             raise LiigaAPIError(f"Error fetching {self.endpoint_name}: {e}") from e
+        except ijson.JSONError as e:
+            raise LiigaAPIError(f"Error decoding {self.endpoint_name} response: {e}") from e
+        if not found:
+            raise LiigaAPIError(f"Unexpected response for {self.endpoint_name}: no {container or 'top level'!r} list")
 
-    @functools.cached_property
+    def _fetch(self) -> Any:
+        url = f"{self.BASE_URL}/{self.url_str}"
+        params = tuple(sorted(self.params.items()))
+        if self._SHARED_RESPONSE:
+            return _get_json_shared(url, params)
+        return _get_json(url, params)
+
+    @property
     def data(self) -> Any:
         """Parses and caches the API response."""
-        return self._parse()
+        try:
+            return self._data
+        except AttributeError:
+            pass
+        self._data = self._parse()
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+
+    @data.deleter
+    def data(self) -> None:
+        try:
+            del self._data
+        except AttributeError:
+            pass
     
     def _parse(self) -> Optional[Any]:
         # Default parse for simple endpoints
@@ -54,20 +272,62 @@ class Endpoint:
         except Exception as e:
             raise LiigaAPIError(f"Error parsing {self.endpoint_name}: {e}") from e
 
-    def get_data_frame(self) -> Any:
+    def get_data_frame(self, optimize_dtypes: bool = False) -> Any:
         """Returns parsed dataframe of the endpoints response
-        Returns a single dataframe or a list of dataframes based on endpoint and parameters"""
+        Returns a single dataframe or a list of dataframes based on endpoint and parameters
+        With optimize_dtypes=True repeated text columns are stored as category and numbers as 32-bit types"""
         # Returns multiple dataframes if data is a list of list of dicts
         if isinstance(self.data, list) and self.data and isinstance(self.data[0], list):
-            
-            return [pd.DataFrame(sublist) for sublist in self.data]
+            dfs = [pd.DataFrame(sublist) for sublist in self.data]
+            return [self._optimize_dtypes(df) for df in dfs] if optimize_dtypes else dfs
         # Otherwise returns single dataframe
         elif isinstance(self.data, list):
-            return pd.DataFrame(self.data)
+            df = pd.DataFrame(self.data)
         elif isinstance(self.data, dict):
-            return pd.DataFrame([self.data])
+            df = pd.DataFrame([self.data])
         else:
             raise LiigaAPIError(f"Cannot convert data to DataFrame for {self.endpoint_name}.")
+        return self._optimize_dtypes(df) if optimize_dtypes else df
+
+    def to_arrow(self) -> Any:
+        """Returns the parsed data as a pyarrow Table, or a list of tables where get_data_frame returns a list.
+        Columns are built by Arrow directly from the records without a DataFrame in between. Requires pyarrow."""
+        # Imported here, pyarrow is optional and slow to import
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise LiigaAPIError(f"to_arrow for {self.endpoint_name} requires the optional pyarrow package.") from e
+
+        def to_table(records: list) -> Any:
+            # Columns are the union of the record keys in first seen order, same as pd.DataFrame(records)
+            columns = dict.fromkeys(key for record in records for key in record)
+            return pyarrow.table({col: [record.get(col) for record in records] for col in columns})
+
+        if isinstance(self.data, list) and self.data and isinstance(self.data[0], list):
+            return [to_table(sublist) for sublist in self.data]
+        elif isinstance(self.data, list):
+            return to_table(self.data)
+        elif isinstance(self.data, dict):
+            return to_table([self.data])
+        raise LiigaAPIError(f"Cannot convert data to Arrow for {self.endpoint_name}.")
+
+    def to_parquet(self, path: str, **kwargs) -> None:
+        """Writes the parsed data to a parquet file, extra keyword arguments are passed on to pyarrow.parquet.write_table.
+        Requires pyarrow."""
+        table = self.to_arrow()
+        if isinstance(table, list):
+            raise LiigaAPIError(f"{self.endpoint_name} returns multiple tables, write them from to_arrow() instead.")
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(table, path, **kwargs)
+
+    def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Downcast the columns listed in the class dtype attributes, skipping columns not in the frame."""
+        cat_cols = [c for c in self._CATEGORICAL_COLS if c in df.columns]
+        int_cols = [c for c in self._INT32_COLS if c in df.columns]
+        float_cols = [c for c in self._FLOAT32_COLS if c in df.columns]
+        # Nullable Int32 keeps missing values instead of failing the cast
+        dtypes = {c: "category" for c in cat_cols} | {c: "Int32" for c in int_cols} | {c: "float32" for c in float_cols}
+        return df.astype(dtypes)
     
     def get_json(self) -> str:
         """Return parsed json string(s) of the endpoints response"""
@@ -82,6 +342,9 @@ class Endpoint:
         return self.response
     
     def clear_cache(self) -> None:
+        """Clears the cached response and parsed data. For shared responses this clears every shared url."""
+        if self._SHARED_RESPONSE:
+            clear_cache()
         del self.response
         del self.data
         return None
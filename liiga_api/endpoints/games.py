@@ -1,29 +1,132 @@
-import functools
-import requests
-import pandas as pd
-import json
-from typing import Optional, Dict, Any, Literal
-from liiga_api.utils import flatten_dict, ResponseParser
+import sys
+from collections import defaultdict
+from itertools import chain
+from types import MappingProxyType
+from typing import Iterable, Iterator, Literal
+from liiga_api.utils import flatten_dict, ResponseParser, resolve_gametype
 from liiga_api.base import Endpoint
 from liiga_api.exceptions import LiigaAPIError
 
 
+# Gametype options shared by the season level games endpoints
+_GAMETYPE_OPTIONS = MappingProxyType({
+    "regularseason": "runkosarja",
+    "playoff": "playoffs",
+    "preseason": "valmistavat_ottelut",
+    "playout": "playout",
+    "qualification": "qualifications",
+    "chl": "chl"
+})
+_GAMETYPE_LITERAL = Literal["regularseason", "playoff", "preseason", "playout", "qualification", "chl"]
+
+
+# Kept from the first period a player appears in when summing periods
+_SUM_ID_KEYS = frozenset(("playerId", "jerseyId", "teamId"))
+
+
+def _sum_player_periods(rows: Iterable[dict]) -> list[dict]:
+    """Sums per period player stats into one row per player, sorted by playerId.
+    Each player's rows must arrive in period order. Keeps identifiers from the first period and the
+    highest period number, sums numbers and flags and keeps the last known other values.
+    Missing (None) values are skipped.
+
+    >>> _sum_player_periods([{"playerId": 1, "period": 1, "shots": 4, "winningGoal": True},
+    ...                      {"playerId": 1, "period": 2, "shots": None, "winningGoal": None},
+    ...                      {"playerId": 1, "period": 3, "shots": 1, "winningGoal": False}])
+    [{'playerId': 1, 'period': 3, 'shots': 5, 'winningGoal': 1}]
+    """
+    player_totals: dict = {}
+    player_ids: list = []
+    summed_keys = last_keys = None
+    for player in rows:
+        player_id = player.get("playerId")
+        if not player_id:
+            continue
+
+        total = player_totals.get(player_id)
+        if total is None:
+            if summed_keys is None:
+                # Columns are classified once per game from the first row, every row comes from the same parsers.
+                # Numbers, flags (bools sum as ints) and missing values are summed, the rest keep the last value
+                stat_keys = [k for k in player if k not in _SUM_ID_KEYS and k != "period"]
+                summed_keys = tuple(k for k in stat_keys if player[k] is None or isinstance(player[k], (int, float)))
+                last_keys = tuple(k for k in stat_keys if k not in summed_keys)
+            # Initialize with a copy of the first period's data
+            player_totals[player_id] = player.copy()
+            player_ids.append(player_id)
+            continue
+
+        # The first period's copy holds every column, the parsers emit all their keys
+        period = player.get("period")
+        if period is not None and (total["period"] is None or period > total["period"]):
+            total["period"] = period
+        for k in summed_keys:
+            v = player.get(k)
+            if v is None:
+                continue
+            try:
+                if total[k] is None:
+                    total[k] = v
+                else:
+                    total[k] += v
+            except KeyError:
+                # Puck columns are missing for periods without puck stats
+                total[k] = v
+        for k in last_keys:
+            v = player.get(k)
+            if v is not None:
+                total[k] = v
+    # Ids are collected on first insert and sorted in place once
+    player_ids.sort()
+    return [player_totals[pid] for pid in player_ids]
+
+
+def _assistant_columns(assistants: list) -> dict:
+    """First and second assistant of a goal event as flat columns, None when missing."""
+    assistant1 = assistants[0] if len(assistants) > 0 else {}
+    assistant2 = assistants[1] if len(assistants) > 1 else {}
+    return {
+        "assistant1Id": assistant1.get("playerId"),
+        "assistant1FirstName": assistant1.get("firstName"),
+        "assistant1LastName": assistant1.get("lastName"),
+        "assistant2Id": assistant2.get("playerId"),
+        "assistant2FirstName": assistant2.get("firstName"),
+        "assistant2LastName": assistant2.get("lastName"),
+    }
+
+
+def _game_goal_events(game: dict, parse_game, parse_goal) -> list[dict]:
+    """Goal events of both teams of one game, each with the game info columns."""
+    game_info = parse_game(game)
+    # Interned so every event of the season points to the same team id strings
+    home, away = game["homeTeam"], game["awayTeam"]
+    hometeam_id = sys.intern(home["teamId"].partition(":")[0])
+    awayteam_id = sys.intern(away["teamId"].partition(":")[0])
+
+    return [
+        {
+            **parse_goal(e),
+            "homeTeamId": hometeam_id,
+            "awayTeamId": awayteam_id,
+            "goalTeamSide": side,
+            **_assistant_columns(e.get("assistantPlayers") or []),
+            **game_info,
+        }
+        for side, team in (("home", home), ("away", away))
+        for e in team.get("goalEvents", ())
+    ]
+
+
 # GAMES RESULTS AND SCHEDULE ENDPOINTS 
 
 class GamesSimpleResults(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications",
-        "chl": "chl"
-    }
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification", "chl"]
+    __slots__ = ()
+
+    GAMETYPE_OPTIONS = _GAMETYPE_OPTIONS
+    gametype_literal = _GAMETYPE_LITERAL
+
     def __init__(self, season: str, gametype: gametype_literal = "regularseason"):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         url_str: str = f"schedule?tournament={gtype}&season={season}"
         super().__init__(endpoint_name="GamesSimpleResults", url_str=url_str)
 
@@ -32,18 +135,18 @@ class GamesSimpleResults(Endpoint):
             raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
 
         results = []
-        data = self.response
-        for item in data:
-            # Rename 'id' to 'rinkId' in 'iceRink' to avoid collision
-            if "iceRink" in item and isinstance(item["iceRink"], dict):
-                item["iceRink"]["rinkId"] = item["iceRink"].pop("id")
-
-            # Flatten the item
-            flattened = flatten_dict(item)
-            results.append(flattened)
+        for item in self.response:
+            # Rename 'id' to 'rinkId' in 'iceRink' to avoid collision, on a copy so the response is left as is
+            rink = item.get("iceRink")
+            if isinstance(rink, dict):
+                rink = dict(rink)
+                rink["rinkId"] = rink.pop("id", None)
+                item = {**item, "iceRink": rink}
+            results.append(flatten_dict(item))
         return results
 
 class GamesResults(Endpoint):
+    __slots__ = ("columns",)
     
     _COLUMNS = {
         # Game-level fields
@@ -109,34 +212,46 @@ class GamesResults(Endpoint):
         "iceRink.zip": "iceRinkZip",
         "iceRink.city": "iceRinkCity",
     }
-
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications",
-        "chl": "chl"
-    }
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification", "chl"]
-    def __init__(self, season: str, gametype: gametype_literal = "regularseason"):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+    _parse_game = staticmethod(ResponseParser._compile_record_parser(_COLUMNS))
+
+    _CATEGORICAL_COLS = ("season", "finishedType", "serie", "provider", "homeTeamId", "homeTeamName",
+                         "awayTeamId", "awayTeamName", "iceRinkId", "iceRinkName", "iceRinkCity")
+    _INT32_COLS = ("gameId", "gameTime", "spectators", "currentPeriod", "gameWeek", "homeGoals", "awayGoals",
+                   "homePowerplayInstances", "homePowerplayGoals", "homeShortHandedInstances", "homeShortHandedGoals",
+                   "awayPowerplayInstances", "awayPowerplayGoals", "awayShortHandedInstances", "awayShortHandedGoals")
+    _FLOAT32_COLS = ("homeExpectedGoals", "awayExpectedGoals")
+
+    # Same url as GamesGoalEvents, see GamesBundle
+    _SHARED_RESPONSE = True
+
+    GAMETYPE_OPTIONS = _GAMETYPE_OPTIONS
+    gametype_literal = _GAMETYPE_LITERAL
+
+    def __init__(self, season: str, gametype: gametype_literal = "regularseason", columns: list[str] | None = None):
+        # Optional subset of the output columns to extract
+        self.columns = columns
+        if columns is not None:
+            ResponseParser._select_columns(self._COLUMNS, columns)
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         url_str: str = f"games?tournament={gtype}&season={season}"
         super().__init__(endpoint_name="GamesResults", url_str=url_str)
 
-    def _parse(self):
-        games = []
-        for game_data in self.response:
-            game_record = ResponseParser._parse_record(game_data, self._COLUMNS)
-            game_record['homeTeamId'] = game_record['homeTeamId'].split(':')[0]
-            game_record['awayTeamId'] = game_record['awayTeamId'].split(':')[0]
-            games.append(game_record)
+    def _parse(self) -> list[dict]:
+        if not self.response:
+            return []
+        # Generated parsers are looked up here rather than stored, so instances stay picklable
+        parse_game = self._parse_game if self.columns is None else ResponseParser._record_parser(
+            ResponseParser._select_columns(self._COLUMNS, self.columns))
+        games = [parse_game(g) for g in self.response]
+        for game in games:
+            for col in ("homeTeamId", "awayTeamId"):
+                if game.get(col):
+                    game[col] = game[col].partition(':')[0]
         return games
     
 
 class GamesGoalEvents(Endpoint):
+    __slots__ = ("stream",)
 
     _GAME_COLUMNS = {
         "id": "gameId",
@@ -145,6 +260,7 @@ class GamesGoalEvents(Endpoint):
         "homeTeam.teamName": "homeTeam",
         "awayTeam.teamName": "awayTeam",
     }
+    _parse_game = staticmethod(ResponseParser._compile_record_parser(_GAME_COLUMNS))
     
     # Goal event columns
     _GOAL_COLUMNS = {
@@ -169,63 +285,60 @@ class GamesGoalEvents(Endpoint):
         "videoClipUrl": "videoClipUrl",
         "videoThumbnailUrl": "videoThumbnailUrl",
     }
+    _parse_goal = staticmethod(ResponseParser._compile_record_parser(_GOAL_COLUMNS))
 
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications",
-        "chl": "chl"
-    }
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification", "chl"]
-    def __init__(self, season: str, gametype: gametype_literal = "regularseason"):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+    _CATEGORICAL_COLS = ("season", "homeTeam", "awayTeam", "homeTeamId", "awayTeamId", "goalTeamSide")
+    _INT32_COLS = ("gameId", "eventId", "period", "gameTime", "homeTeamScore", "awayTeamScore")
+
+    # Same url as GamesResults, see GamesBundle
+    _SHARED_RESPONSE = True
+
+    GAMETYPE_OPTIONS = _GAMETYPE_OPTIONS
+    gametype_literal = _GAMETYPE_LITERAL
+
+    def __init__(self, season: str, gametype: gametype_literal = "regularseason", stream: bool = False):
+        # With stream=True games are parsed while the response downloads (requires ijson)
+        self.stream = stream
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         url_str: str = f"games?tournament={gtype}&season={season}"
         super().__init__(endpoint_name="GamesGoalEvents", url_str=url_str)
 
     
     def _parse(self) -> list[dict]:
-        response = self.response
-        all_goal_events = []
+        response = self._stream_items("item") if self.stream else self.response
+        return list(chain.from_iterable(_game_goal_events(r, self._parse_game, self._parse_goal) for r in response))
+
 
-        for r in response:
-            game_info = ResponseParser._parse_record(r, self._GAME_COLUMNS)
-            hometeam_id = r.get("homeTeam").get("teamId").split(":")[0]
-            awayteam_id = r.get("awayTeam").get("teamId").split(":")[0]
+class GamesBundle:
+    """Results and goal events of a season from a single request.
+    GamesResults and GamesGoalEvents read the same url, the decoded response is shared between them."""
 
-            for team_type in ["homeTeam", "awayTeam"]:
-                goal_events = r.get(team_type, {}).get("goalEvents", [])
-                for e in goal_events:
-                    goal_event = ResponseParser._parse_record(e, self._GOAL_COLUMNS)
+    __slots__ = ("_results", "_goal_events")
 
-                    assistants = e.get("assistantPlayers", []) or []
-                    assistant1 = assistants[0] if len(assistants) > 0 else {"playerId": None, "firstName": None, "lastName": None}
-                    assistant2 = assistants[1] if len(assistants) > 1 else {"playerId": None, "firstName": None, "lastName": None}
+    def __init__(self, season: str, gametype: _GAMETYPE_LITERAL = "regularseason"):
+        self._results = GamesResults(season, gametype)
+        self._goal_events = GamesGoalEvents(season, gametype)
 
-                    goal_event.update({
-                        "homeTeamId": hometeam_id,
-                        "awayTeamId": awayteam_id,
-                        "goalTeamSide": "home" if team_type == "homeTeam" else "away",
-                        "assistant1Id": assistant1.get("playerId"),
-                        "assistant1FirstName": assistant1.get("firstName"),
-                        "assistant1LastName": assistant1.get("lastName"),
-                        "assistant2Id": assistant2.get("playerId"),
-                        "assistant2FirstName": assistant2.get("firstName"),
-                        "assistant2LastName": assistant2.get("lastName"),
-                    })
+    def _share_response(self) -> None:
+        # Hands the results response to the goal events, however long ago it was fetched
+        self._goal_events.response = self._results.response
 
-                    goal_event.update(game_info)
-                    all_goal_events.append(goal_event)
+    def results(self) -> list[dict]:
+        self._share_response()
+        return self._results.data
 
-        return all_goal_events
+    def goal_events(self) -> list[dict]:
+        self._share_response()
+        return self._goal_events.data
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(url={self._results.BASE_URL}/{self._results.url_str})"
 
 
 # GAMESTAT ENDPOINTS
 
 class GameInfo(Endpoint):
+    __slots__ = ("columns",)
 
     _COLUMNS = {
         "game.id": "gameId",
@@ -273,19 +386,36 @@ class GameInfo(Endpoint):
         "game.iceRink.city": "iceRinkCity",
         "game.curretPeriod": "currentPeriod"
         }
-    
+    _parse_info = staticmethod(ResponseParser._compile_record_parser(_COLUMNS))
 
-    def __init__(self, game_id: str, season: str):
+    _CATEGORICAL_COLS = ("season", "finishedType", "homeTeamId", "homeTeamName", "awayTeamId", "awayTeamName",
+                         "iceRinkId", "iceRinkName", "iceRinkCity")
+    _INT32_COLS = ("gameId", "gameTime", "spectators", "homeGoals", "awayGoals")
+    _FLOAT32_COLS = ("homeExpectedGoals", "awayExpectedGoals")
+
+    _SHARED_RESPONSE = True
+
+    def __init__(self, game_id: str, season: str, columns: list[str] | None = None):
+        # Optional subset of the output columns to extract
+        self.columns = columns
+        if columns is not None:
+            ResponseParser._select_columns(self._COLUMNS, columns)
         url_str: str = f"games/{season}/{game_id}"
         super().__init__(endpoint_name="GameInfo", url_str=url_str)
 
     def _parse(self):
-        info = ResponseParser._parse_record(self.response, self._COLUMNS)
-        info['homeTeamId'] = info['homeTeamId'].split(':')[0]
-        info['awayTeamId'] = info['awayTeamId'].split(':')[0]
+        # Single record, the generated parser is far cheaper than building a DataFrame with json_normalize
+        parse_info = self._parse_info if self.columns is None else ResponseParser._record_parser(
+            ResponseParser._select_columns(self._COLUMNS, self.columns))
+        info = parse_info(self.response)
+        if 'homeTeamId' in info:
+            info['homeTeamId'] = info['homeTeamId'].partition(':')[0]
+        if 'awayTeamId' in info:
+            info['awayTeamId'] = info['awayTeamId'].partition(':')[0]
         return info
 
 class GameGoalEvents(Endpoint):
+    __slots__ = ()
 
     _GAME_COLUMNS = {
         "id": "gameId",
@@ -294,6 +424,7 @@ class GameGoalEvents(Endpoint):
         "homeTeam.teamName": "homeTeam",
         "awayTeam.teamName": "awayTeam"
     }
+    _parse_game = staticmethod(ResponseParser._compile_record_parser(_GAME_COLUMNS))
 
     _GOAL_COLUMNS = {
         "scorerPlayerId": "scorerPlayerId",
@@ -317,6 +448,12 @@ class GameGoalEvents(Endpoint):
         "videoClipUrl": "videoClipUrl",
         "videoThumbnailUrl": "videoThumbnailUrl",
     }
+    _parse_goal = staticmethod(ResponseParser._compile_record_parser(_GOAL_COLUMNS))
+
+    _CATEGORICAL_COLS = ("season", "homeTeam", "awayTeam", "homeTeamId", "awayTeamId", "goalTeamSide")
+    _INT32_COLS = ("gameId", "eventId", "period", "gameTime", "homeTeamScore", "awayTeamScore")
+
+    _SHARED_RESPONSE = True
 
     def __init__(self, game_id: str, season: str):
         url_str: str = f"games/{season}/{game_id}"
@@ -324,40 +461,11 @@ class GameGoalEvents(Endpoint):
 
 
     def _parse(self):
-        game = self.response["game"]
-        all_goal_events = []
-        game_info = ResponseParser._parse_record(game, self._GAME_COLUMNS)
-        hometeam_id = game.get("homeTeam").get("teamId").split(":")[0]
-        awayteam_id = game.get("awayTeam").get("teamId").split(":")[0]
-
-        for team_type in ["homeTeam", "awayTeam"]:
-                goal_events = game.get(team_type, {}).get("goalEvents", [])
-                for e in goal_events:
-                    goal_event = ResponseParser._parse_record(e, self._GOAL_COLUMNS)
-
-                    assistants = e.get("assistantPlayers", []) or []
-                    assistant1 = assistants[0] if len(assistants) > 0 else {"playerId": None, "firstName": None, "lastName": None}
-                    assistant2 = assistants[1] if len(assistants) > 1 else {"playerId": None, "firstName": None, "lastName": None}
-
-                    goal_event.update({
-                        "homeTeamId": hometeam_id,
-                        "awayTeamId": awayteam_id,
-                        "goalTeamSide": "home" if team_type == "homeTeam" else "away",
-                        "assistant1Id": assistant1.get("playerId"),
-                        "assistant1FirstName": assistant1.get("firstName"),
-                        "assistant1LastName": assistant1.get("lastName"),
-                        "assistant2Id": assistant2.get("playerId"),
-                        "assistant2FirstName": assistant2.get("firstName"),
-                        "assistant2LastName": assistant2.get("lastName"),
-                    })
-
-                    goal_event.update(game_info)
-                    all_goal_events.append(goal_event)
-
-        return all_goal_events
+        return _game_goal_events(self.response["game"], self._parse_game, self._parse_goal)
 
 
 class GamePenaltyEvents(Endpoint):
+    __slots__ = ()
 
 
     _GAME_COLUMNS = {
@@ -367,6 +475,7 @@ class GamePenaltyEvents(Endpoint):
         "homeTeam.teamName": "homeTeam",
         "awayTeam.teamName": "awayTeam"
     }
+    _parse_game = staticmethod(ResponseParser._compile_record_parser(_GAME_COLUMNS))
 
     _PENALTY_COLUMNS = {
         "playerId": "playerId",
@@ -382,7 +491,14 @@ class GamePenaltyEvents(Endpoint):
         "penaltyInfo": "penaltyInfo",
         "penaltyMinutes": "penaltyMinutes"
         }
+    _parse_penalty = staticmethod(ResponseParser._compile_record_parser(_PENALTY_COLUMNS))
+
+    _CATEGORICAL_COLS = ("season", "homeTeam", "awayTeam", "homeTeamId", "awayTeamId", "penaltyTeamSide",
+                         "penaltyFaultName", "penaltyFaultType")
+    _INT32_COLS = ("gameId", "eventId", "period", "gameTime", "penaltyMinutes")
     
+    _SHARED_RESPONSE = True
+
     def __init__(self, game_id: str, season: str):
         url_str: str = f"games/{season}/{game_id}"
         super().__init__(endpoint_name="GamePenaltyEvents", url_str=url_str)
@@ -390,26 +506,22 @@ class GamePenaltyEvents(Endpoint):
 
     def _parse(self):
         game = self.response["game"]
-        all_penalty_events = []
-        game_info = ResponseParser._parse_record(game, self._GAME_COLUMNS)
-        hometeam_id = game.get("homeTeam").get("teamId").split(":")[0]
-        awayteam_id = game.get("awayTeam").get("teamId").split(":")[0]
-
-        for team_type in ["homeTeam", "awayTeam"]:
-                penalty_events = game.get(team_type, {}).get("penaltyEvents", [])
-                for e in penalty_events:
-                    penalty_event = ResponseParser._parse_record(e, self._PENALTY_COLUMNS)
-
-                    penalty_event.update({
-                        "homeTeamId": hometeam_id,
-                        "awayTeamId": awayteam_id,
-                        "penaltyTeamSide": "home" if team_type == "homeTeam" else "away"
-                    })
-
-                    penalty_event.update(game_info)
-                    all_penalty_events.append(penalty_event)
-
-        return all_penalty_events
+        game_info = self._parse_game(game)
+        home, away = game["homeTeam"], game["awayTeam"]
+        hometeam_id = sys.intern(home["teamId"].partition(":")[0])
+        awayteam_id = sys.intern(away["teamId"].partition(":")[0])
+
+        return [
+            {
+                **self._parse_penalty(e),
+                "homeTeamId": hometeam_id,
+                "awayTeamId": awayteam_id,
+                "penaltyTeamSide": side,
+                **game_info,
+            }
+            for side, team in (("home", home), ("away", away))
+            for e in team.get("penaltyEvents", ())
+        ]
 
 #class GameGoalKeeperEvents(Endpoint):
     #pass
@@ -419,53 +531,49 @@ class GamePenaltyEvents(Endpoint):
 
 
 class GameReferees(Endpoint):
+    __slots__ = ()
+
+    _SHARED_RESPONSE = True
+
     def __init__(self, game_id: str, season: str):
         url_str: str = f"games/{season}/{game_id}"
         super().__init__(endpoint_name="GameReferees", url_str=url_str)
 
     
     def _parse(self):
-        game = self.response["game"]
-        refs = []
-        for ref in game['referees']:
-            refs.append(ref)
-        return refs
+        return list(self.response["game"]['referees'])
         
 
 
 class GameAwards(Endpoint):
+    __slots__ = ()
+
+    _SHARED_RESPONSE = True
+
     def __init__(self, game_id: str, season: str):
         url_str: str = f"games/{season}/{game_id}"
         super().__init__(endpoint_name="GameAwards", url_str=url_str)
 
     def _parse(self):
-        awards = []
-        for a in self.response["awards"]:
-            a['teamId'] = a['teamId'].split(':')[0]
-            awards.append(a)
-        return awards
+        return [{**a, 'teamId': a['teamId'].partition(':')[0]} for a in self.response["awards"]]
 
 
 class GamePlayers(Endpoint):
+    __slots__ = ()
+
+    _SHARED_RESPONSE = True
+
     def __init__(self, game_id: str, season: str):
         url_str: str = f"games/{season}/{game_id}"
         super().__init__(endpoint_name="GamePlayers", url_str=url_str)
 
     def _parse(self):
-        homeplayers = self.response['homeTeamPlayers']
-        awayplayers = self.response['awayTeamPlayers']
-
-        players = []
-
-        for team in [homeplayers, awayplayers]:
-            for player in team:
-                player['teamId'] = player['teamId'].split(':')[0]
-                players.append(player)
-
-        return players
+        players = chain(self.response['homeTeamPlayers'], self.response['awayTeamPlayers'])
+        return [{**player, 'teamId': player['teamId'].partition(':')[0]} for player in players]
 
 
 class SkaterGameStats(Endpoint):
+    __slots__ = ("summed",)
 
     _PERIOD_PLAYERSTAT_KEYS = {
         "jerseyId": "jerseyId",
@@ -518,6 +626,7 @@ class SkaterGameStats(Endpoint):
         "expectedGoalsAgainst": "expectedGoalsAgainst",
         "expectedGoalsAgainstShotOnGoal": "expectedGoalsAgainstShotOnGoal"
     }
+    _parse_player_period = staticmethod(ResponseParser._compile_record_parser(_PERIOD_PLAYERSTAT_KEYS))
     _PERIOD_TEAM_CONTEXT = {
         "teamId": "teamId",
         "goals": "teamGoals",
@@ -532,6 +641,7 @@ class SkaterGameStats(Endpoint):
         "twentyMinutePenalties": "teamTwentyMinutePenalties",
         "totalDistanceTravelled": "teamTotalDistanceTravelled"
     }
+    _parse_team_period = staticmethod(ResponseParser._compile_record_parser(_PERIOD_TEAM_CONTEXT))
 
     _PERIOD_PUCK_KEYS = {
         "periodNumber": "periodNumber",
@@ -540,6 +650,14 @@ class SkaterGameStats(Endpoint):
         "contestedControlDuration": "contestedControlDuration",
         "distance": "distance"
     }
+    _parse_puck = staticmethod(ResponseParser._compile_record_parser(_PERIOD_PUCK_KEYS))
+
+    _CATEGORICAL_COLS = ("teamId", "teamSide")
+    _INT32_COLS = ("jerseyId", "period", "points", "assists", "goals", "plusminus", "plus", "minus", "shots",
+                   "penaltyminutes", "powerplayGoals", "shortHandedGoals", "blockedShots", "faceoffsTotal",
+                   "faceoffsWon", "timeofice", "totalPasses", "successfulPasses")
+    _FLOAT32_COLS = ("distance", "expectedGoalsPlayer", "expectedGoalsTeam", "expectedGoalsAgainst",
+                     "expectedGoalsAgainstShotOnGoal")
 
     def __init__(self, game_id: str, season: str, summed: bool = True):
         if not isinstance(summed, bool):
@@ -548,68 +666,53 @@ class SkaterGameStats(Endpoint):
         url_str: str = f"games/stats/{season}/{game_id}"
         super().__init__(endpoint_name='SkaterGameStats', url_str=url_str)
 
+    @classmethod
+    def fetch_season(cls, season: str, gametype: str = "regularseason", summed: bool = True, max_workers: int = 8) -> list:
+        """Fetches stats for every finished game of a season concurrently.
+        Returns a list of SkaterGameStats in schedule order."""
+        games = GamesResults(season, gametype).data
+        params = [{"game_id": g["gameId"], "season": season, "summed": summed} for g in games if g["ended"]]
+        return cls.fetch_many(params, max_workers=max_workers)
+
     
     def _parse(self):
         return self._parse_sum_players() if self.summed else self._parse_by_period()
     
-    def _parse_by_period(self) -> list[list[dict]]:
-        periods_out = {}
-
-        puck_stats = [ResponseParser._parse_record(p, self._PERIOD_PUCK_KEYS) for p in self.response.get("puckStats", [])]
+    def _iter_player_stats(self) -> Iterator[dict]:
+        """Yields one row per player and period, home team periods first."""
+        puck_stats = [self._parse_puck(p) for p in self.response.get("puckStats", [])]
 
-        for side in ["homeTeam", "awayTeam"]:
+        for side, team_side in (("homeTeam", "home"), ("awayTeam", "away")):
             team_periods = self.response.get(side, [])
             for i, period in enumerate(team_periods):
-                team_stats = ResponseParser._parse_record(period, self._PERIOD_TEAM_CONTEXT)
-                team_stats['teamId'] = team_stats['teamId'].split(':')[0]
+                team_stats = self._parse_team_period(period)
+                team_stats['teamId'] = team_stats['teamId'].partition(':')[0]
 
                 # Get puck stats for this period if available, otherwise use empty dict
                 puck_period = puck_stats[i] if i < len(puck_stats) else {}
 
                 for player in period.get("periodPlayerStats", []):
-                    player_stats = ResponseParser._parse_record(player, self._PERIOD_PLAYERSTAT_KEYS)
+                    player_stats = self._parse_player_period(player)
                     player_stats.update(team_stats)
                     player_stats.update(puck_period)
-                    player_stats['teamSide'] = side.replace("Team", "").lower()
-                    period_number = player_stats.get("period")
-                    if period_number not in periods_out:
-                        periods_out[period_number] = []
-                    periods_out[period_number].append(player_stats)
+                    player_stats['teamSide'] = team_side
+                    yield player_stats
 
-        return [periods_out[p] for p in sorted(periods_out.keys()) if periods_out[p]]
+    def _parse_by_period(self) -> list[list[dict]]:
+        periods_out = defaultdict(list)
+        for player_stats in self._iter_player_stats():
+            periods_out[player_stats.get("period")].append(player_stats)
+
+        # Keys are only created by append, so every period list is non-empty
+        return [periods_out[p] for p in sorted(periods_out)]
     
     
     def _parse_sum_players(self) -> list[dict]:
-        by_period = self._parse_by_period()
-        player_totals: dict[str, dict] = {}
-
-        for period in by_period:
-            for player in period:
-                player_id = player.get("playerId")
-                if not player_id:
-                    continue
-
-                # Initialize with a copy of the first period's data
-                if player_id not in player_totals:
-                    player_totals[player_id] = player.copy()
-                else:
-                    total = player_totals[player_id]
-                    for k, v in player.items():
-                        # Skip identifiers
-                        if k in ["playerId", "jerseyId", "teamId"]:
-                            continue
-                        if k == "period":
-                            # Keep the highest period number
-                            total[k] = max(total.get(k, 0), v if isinstance(v, int) else 0)
-                        elif isinstance(v, (int, float)):
-                            # Sum numeric values
-                            total[k] = total.get(k, 0) + v
-                        elif v is not None:
-                            total[k] = v
-        # Optionally, sort by playerId for consistency
-        return [player_totals[pid] for pid in sorted(player_totals)]
+        # A player's rows come from one team's periods, which the response lists in period order
+        return _sum_player_periods(self._iter_player_stats())
     
 class GoalieGameStats(Endpoint):
+    __slots__ = ("summed",)
 
     _PERIOD_PLAYERSTAT_KEYS = {
         "jerseyId": "jerseyId",
@@ -664,6 +767,7 @@ class GoalieGameStats(Endpoint):
         "expectedGoalsAgainst": "expectedGoalsAgainst",
         "expectedGoalsAgainstShotOnGoal": "expectedGoalsAgainstShotOnGoal"
     }
+    _parse_player_period = staticmethod(ResponseParser._compile_record_parser(_PERIOD_PLAYERSTAT_KEYS))
 
 
     _PERIOD_TEAM_CONTEXT = {
@@ -680,6 +784,7 @@ class GoalieGameStats(Endpoint):
         "twentyMinutePenalties": "teamTwentyMinutePenalties",
         "totalDistanceTravelled": "teamTotalDistanceTravelled"
     }
+    _parse_team_period = staticmethod(ResponseParser._compile_record_parser(_PERIOD_TEAM_CONTEXT))
 
     _PERIOD_PUCK_KEYS = {
         "periodNumber": "periodNumber",
@@ -688,6 +793,13 @@ class GoalieGameStats(Endpoint):
         "contestedControlDuration": "contestedControlDuration",
         "distance": "distance"
     }
+    _parse_puck = staticmethod(ResponseParser._compile_record_parser(_PERIOD_PUCK_KEYS))
+
+    _CATEGORICAL_COLS = ("teamId", "teamSide")
+    _INT32_COLS = ("jerseyId", "period", "shotsOnGoal", "saves", "goalsAllowed", "penaltyminutes", "timeofice",
+                   "assists", "goals", "points")
+    _FLOAT32_COLS = ("savesPercentage", "distance", "expectedGoalsPlayer", "expectedGoalsTeam",
+                     "expectedGoalsAgainst", "expectedGoalsAgainstShotOnGoal")
 
     def __init__(self, game_id: str, season: str, summed: bool = True):
         if not isinstance(summed, bool):
@@ -700,64 +812,39 @@ class GoalieGameStats(Endpoint):
     def _parse(self):
         return self._parse_sum_players() if self.summed else self._parse_by_period()
     
-    def _parse_by_period(self) -> list[list[dict]]:
-        periods_out = {}
+    def _iter_player_stats(self) -> Iterator[dict]:
+        """Yields one row per goalie and period, home team periods first."""
+        puck_stats = [self._parse_puck(p) for p in self.response.get("puckStats", [])]
 
-        puck_stats = [ResponseParser._parse_record(p, self._PERIOD_PUCK_KEYS) for p in self.response.get("puckStats", [])]
-
-        for side in ["homeTeam", "awayTeam"]:
+        for side, team_side in (("homeTeam", "home"), ("awayTeam", "away")):
             team_periods = self.response.get(side, [])
             for period, puck_period in zip(team_periods, puck_stats):
-                team_stats = ResponseParser._parse_record(period, self._PERIOD_TEAM_CONTEXT)
-                team_stats['teamId'] = team_stats['teamId'].split(':')[0]
-
+                team_stats = self._parse_team_period(period)
+                team_stats['teamId'] = team_stats['teamId'].partition(':')[0]
 
                 for player in period.get("goaliePeriodStats", []):
-                    player_stats = ResponseParser._parse_record(player, self._PERIOD_PLAYERSTAT_KEYS)
+                    player_stats = self._parse_player_period(player)
                     player_stats.update(team_stats)
                     player_stats.update(puck_period)
-                    player_stats['teamSide'] = side.replace("Team", "").lower()
-                    period_number = player_stats.get("period")
-                    if period_number not in periods_out:
-                        periods_out[period_number] = []
-                    periods_out[period_number].append(player_stats)
-                    
+                    player_stats['teamSide'] = team_side
+                    yield player_stats
 
+    def _parse_by_period(self) -> list[list[dict]]:
+        periods_out = defaultdict(list)
+        for player_stats in self._iter_player_stats():
+            periods_out[player_stats.get("period")].append(player_stats)
 
-        return [periods_out[p] for p in sorted(periods_out.keys()) if periods_out[p]]
+        # Keys are only created by append, so every period list is non-empty
+        return [periods_out[p] for p in sorted(periods_out)]
     
     def _parse_sum_players(self) -> list[dict]:
-        by_period = self._parse_by_period()
-        player_totals: dict[str, dict] = {}
-
-        for period in by_period:
-            for player in period:
-                player_id = player.get("playerId")
-                if not player_id:
-                    continue
-
-                # Initialize with a copy of the first period's data
-                if player_id not in player_totals:
-                    player_totals[player_id] = player.copy()
-                else:
-                    total = player_totals[player_id]
-                    for k, v in player.items():
-                        # Skip identifiers
-                        if k in ["playerId", "jerseyId", "teamId"]:
-                            continue
-                        if k == "period":
-                            # Keep the highest period number
-                            total[k] = max(total.get(k, 0), v if isinstance(v, int) else 0)
-                        elif isinstance(v, (int, float)):
-                            # Sum numeric values
-                            total[k] = total.get(k, 0) + v
-                        elif v is not None:
-                            total[k] = v
-        # Optionally, sort by playerId for consistency
-        return [player_totals[pid] for pid in sorted(player_totals)]
+        # A player's rows come from one team's periods, which the response lists in period order
+        return _sum_player_periods(self._iter_player_stats())
 
 
 class GameShotMap(Endpoint):
+    __slots__ = ()
+
     def __init__(self, game_id: str, season: str):
         url_str: str = f"shotmap/{season}/{game_id}"
         super().__init__(endpoint_name="GameShotMap", url_str=url_str)
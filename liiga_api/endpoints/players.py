@@ -1,9 +1,8 @@
-import functools
-import requests
-import pandas as pd
-import json
-from typing import Optional, Dict, Any, Literal
-from liiga_api.utils import flatten_dict, ResponseParser
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Literal
+from liiga_api.utils import ResponseParser, resolve_gametype
 from liiga_api.base import Endpoint
 from liiga_api.exceptions import LiigaAPIError
 
@@ -35,31 +34,32 @@ class PlayerGameLog(Endpoint):
 
     # OVERRIDE DEFAULT PARSE
     def _parse(self) -> list[dict]:
-        gametypes = self.response.keys()
-
         if self.gtype != "":
             if self.gtype not in self.response:
                 raise LiigaAPIError(f"Gametype '{self.gtype}' not available. ")
             games = self.response[self.gtype]
 
         else:
-            games = []
-            for g in list(gametypes):
-                games.extend(self.response[g])
+            games = list(chain.from_iterable(self.response.values()))
 
         return games
 
 
 class PlayerActiveSeasons(Endpoint):
+    # Same url for all players/info endpoints, fetched once
+    _SHARED_RESPONSE = True
+
     def __init__(self, player_id: str):
         url_str: str = f"players/info/{player_id}"
         super().__init__(endpoint_name="PlayerActiveSeasons", url_str=url_str)
     
     def _parse(self) -> list:
-        return self.response["activeSeasons"]
+        return list(self.response["activeSeasons"])
 
 
 class PlayerProfile(Endpoint):
+    # Same url for all players/info endpoints, fetched once
+    _SHARED_RESPONSE = True
 
     _COLUMNS = {
         "birthLocality.country.name": "birthCountry",
@@ -77,17 +77,19 @@ class PlayerProfile(Endpoint):
         "nationality.code": "nationalityCode",
         "weight": "weight"
     }
-
+    _parse_profile = staticmethod(ResponseParser._compile_record_parser(_COLUMNS))
 
     def __init__(self, player_id: str):
         url_str: str = f"players/info/{player_id}"
         super().__init__(endpoint_name="PlayerProfile", url_str=url_str)
     
     def _parse(self) -> dict:
-        profile = ResponseParser._parse_record(self.response, self._COLUMNS)
-        return profile
+        return self._parse_profile(self.response)
 
 class PlayerTeamsPlayedFor(Endpoint):
+    # Same url for all players/info endpoints, fetched once
+    _SHARED_RESPONSE = True
+
     def __init__(self, player_id: str):
         url_str: str = f"players/info/{player_id}"
         super().__init__(endpoint_name="PlayerTeamsPlayedFor", url_str=url_str)
@@ -95,10 +97,9 @@ class PlayerTeamsPlayedFor(Endpoint):
     def _parse(self) -> list[dict]:
         
         teams_data = self.response.get("teams", {})
-        
-        teams = []
-        for season_key, team_info in teams_data.items():
-            teams.append({
+
+        return [
+            {
                 "season": team_info["season"],
                 "teamId": team_info["teamId"],
                 "teamName": team_info["teamName"],
@@ -106,12 +107,14 @@ class PlayerTeamsPlayedFor(Endpoint):
                 "jersey": team_info.get("jersey"),
                 "position": team_info.get("position"),
                 "imageUrl": team_info.get("imageUrl")
-            })
-
-        return teams
+            }
+            for team_info in teams_data.values()
+        ]
 
 class PlayerStatsPerSeason(Endpoint):
-    
+    # Same url for all players/info endpoints, fetched once
+    _SHARED_RESPONSE = True
+
     GAMETYPE_OPTIONS = {
         "regularseason": "regular",
         "playoff": "playoffs",
@@ -133,15 +136,13 @@ class PlayerStatsPerSeason(Endpoint):
         historical = self.response.get("historical", {})
         
         if self.gametype == "all":
-            all_stats = []
-            for gametype_key, seasons in historical.items():
-                if isinstance(seasons, list):
-                    for season in seasons:
-                        season_copy = season.copy()
-                        season_copy["gametype"] = gametype_key
-                        all_stats.append(season_copy)
+            all_stats = [
+                dict(season, gametype=gametype_key)
+                for gametype_key, seasons in historical.items() if isinstance(seasons, list)
+                for season in seasons
+            ]
             #sort by season and gametype -> no summing, return multiple rows per season, one for each gametype
-            return sorted(all_stats, key=lambda x: (x["season"], x["gametype"]), reverse=True)
+            return sorted(all_stats, key=itemgetter("season", "gametype"), reverse=True)
         else:
             stats = historical.get(self.gametype, [])
 
@@ -154,6 +155,38 @@ class PlayerStatsPerSeason(Endpoint):
 
 # PLAYERS SUMMED STATS
 
+# Gametype options shared by the Players* summed stats endpoints
+_SUMMED_GAMETYPE_OPTIONS = MappingProxyType({
+    "regularseason": "runkosarja",
+    "playoff": "playoffs",
+    "preseason": "valmistavat_ottelut",
+    "playout": "playout",
+    "qualification": "qualifications"
+})
+_SUMMED_GAMETYPE_LITERAL = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+
+
+class _SplitTeamsMixin:
+    """Shared parse for the summed player stats endpoints.
+    With summed=False players who changed teams are split into one row per team."""
+
+    __slots__ = ()
+
+    def _parse(self) -> list[dict]:
+        # Summed rows are the response itself, same as AllPlayers
+        if self.summed:
+            return self.response
+
+        players = []
+        for player_data in self.response:
+            previous_teams = player_data.get("previousTeamsForTournament")
+            if previous_teams:
+                players.extend(previous_teams)
+            else:
+                players.append(player_data)
+        return players
+
+
 class AllPlayers(Endpoint):
     """Fetches and parses aggregated statistics for all Liiga players across a range of seasons.
     """
@@ -172,333 +205,126 @@ class AllPlayers(Endpoint):
         super().__init__(endpoint_name="AllPlayers", url_str=url_str)
 
 
-class PlayersBasicStats(Endpoint):
+class PlayersBasicStats(_SplitTeamsMixin, Endpoint):
     """Fetches and parses basic statistics for Liiga players.
 
     See docs/players_basic_stats.md for detailed documentation and examples.
     """
 
 
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+    GAMETYPE_OPTIONS = _SUMMED_GAMETYPE_OPTIONS
+    gametype_literal = _SUMMED_GAMETYPE_LITERAL
 
     def __init__(self, start_season: str, end_season: str ,gametype: gametype_literal = "regularseason", team_id: str | None = None, summed: bool = True):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         self.summed = summed
         url_str: str = f"players/stats/summed/{start_season}/{end_season}/{gtype}/false?team={team_id}&dataType=basicStats&splitTeams=true"
         super().__init__(endpoint_name="PlayersBasicStats", url_str=url_str)
 
 
-    def _parse(self) -> list[dict]:
-        players = []
-
-        if self.summed:
-            players.extend(self.response)
-
-        else:
-            for player_data in self.response:
-                previous_teams = player_data.get("previousTeamsForTournament")
-                if previous_teams:
-                    players.extend(previous_teams)
-                else:
-                    players.append(player_data)
-        return players
-
-    
-
-class PlayersGoals(Endpoint):
+class PlayersGoals(_SplitTeamsMixin, Endpoint):
     """Fetches and parses goal-specific statistics for Liiga players.
 
     See docs/players_goals.md for detailed documentation and examples.
     """
 
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+    GAMETYPE_OPTIONS = _SUMMED_GAMETYPE_OPTIONS
+    gametype_literal = _SUMMED_GAMETYPE_LITERAL
 
     def __init__(self, start_season: str, end_season: str,gametype: gametype_literal = "regularseason", summed: bool = True):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         self.summed = summed
         url_str: str = f"players/stats/summed/{start_season}/{end_season}/{gtype}/false?team=&dataType=goalStats&splitTeams=true"
         super().__init__(endpoint_name="PlayersGoals", url_str=url_str)
 
 
-
-    def _parse(self) -> list[dict]:
-        players = []
-
-        if self.summed:
-            players.extend(self.response)
-
-        else:
-            for player_data in self.response:
-                previous_teams = player_data.get("previousTeamsForTournament")
-                if previous_teams:
-                    players.extend(previous_teams)
-                else:
-                    players.append(player_data)
-        return players
-
-
-class PlayersShots(Endpoint):
+class PlayersShots(_SplitTeamsMixin, Endpoint):
     """Fetches and parses shot-specific statistics for Liiga players.
 
     See docs/players_shots.md for detailed documentation and examples.
     """
 
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+    GAMETYPE_OPTIONS = _SUMMED_GAMETYPE_OPTIONS
+    gametype_literal = _SUMMED_GAMETYPE_LITERAL
 
     def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason", summed: bool = True):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         self.summed = summed
         url_str: str = f"players/stats/summed/{start_season}/{end_season}/{gtype}/false?team=&dataType=shotStats&splitTeams=true"
         super().__init__(endpoint_name="PlayersShots", url_str=url_str)
 
-    
-
-    def _parse(self) -> list[dict]:
-        players = []
-
-        if self.summed:
-            players.extend(self.response)
-
-        else:
-            for player_data in self.response:
-                previous_teams = player_data.get("previousTeamsForTournament")
-                if previous_teams:
-                    players.extend(previous_teams)
-                else:
-                    players.append(player_data)
-        return players
-
 
-class PlayersPasses(Endpoint):
+class PlayersPasses(_SplitTeamsMixin, Endpoint):
     """Fetches and parses pass-specific statistics for Liiga players.
 
     See docs/players_passes.md for detailed documentation and examples.
     """
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+    GAMETYPE_OPTIONS = _SUMMED_GAMETYPE_OPTIONS
+    gametype_literal = _SUMMED_GAMETYPE_LITERAL
 
     def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason", summed: bool = True):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         self.summed = summed
         url_str: str = f"players/stats/summed/{start_season}/{end_season}/{gtype}/false?team=&dataType=passes&splitTeams=true"
         super().__init__(endpoint_name="PlayersPasses", url_str=url_str)
 
-    
-
-    def _parse(self) -> list[dict]:
-        players = []
-
-        if self.summed:
-            players.extend(self.response)
-
-        else:
-            for player_data in self.response:
-                previous_teams = player_data.get("previousTeamsForTournament")
-                if previous_teams:
-                    players.extend(previous_teams)
-                else:
-                    players.append(player_data)
-        return players
-
 
-class PlayersPenalties(Endpoint):
+class PlayersPenalties(_SplitTeamsMixin, Endpoint):
     """Fetches and parses penalty-specific statistics for Liiga players.
 
     See docs/players_penalties.md for detailed documentation and examples.
     """
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+    GAMETYPE_OPTIONS = _SUMMED_GAMETYPE_OPTIONS
+    gametype_literal = _SUMMED_GAMETYPE_LITERAL
 
     def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason", summed: bool = True):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         self.summed = summed
         url_str: str = f"players/stats/summed/{start_season}/{end_season}/{gtype}/false?team=&dataType=penaltyStats&splitTeams=true"
         super().__init__(endpoint_name="PlayersPenalties", url_str=url_str)
 
 
-
-    def _parse(self) -> list[dict]:
-        players = []
-
-        if self.summed:
-            players.extend(self.response)
-
-        else:
-            for player_data in self.response:
-                previous_teams = player_data.get("previousTeamsForTournament")
-                if previous_teams:
-                    players.extend(previous_teams)
-                else:
-                    players.append(player_data)
-        return players
-
-
-class PlayersGameTime(Endpoint):
+class PlayersGameTime(_SplitTeamsMixin, Endpoint):
     """Fetches and parses time one ice statistics for Liiga players.
 
     See docs/players_gametime.md for detailed documentation and examples.
     """
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+    GAMETYPE_OPTIONS = _SUMMED_GAMETYPE_OPTIONS
+    gametype_literal = _SUMMED_GAMETYPE_LITERAL
 
     def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason", summed: bool = True):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         self.summed = summed
         url_str: str = f"players/stats/summed/{start_season}/{end_season}/{gtype}/false?team=&dataType=gameTimes&splitTeams=true"
         super().__init__(endpoint_name="PlayersGameTime", url_str=url_str)
 
-    
-
-    def _parse(self) -> list[dict]:
-        players = []
-
-        if self.summed:
-            players.extend(self.response)
-
-        else:
-            for player_data in self.response:
-                previous_teams = player_data.get("previousTeamsForTournament")
-                if previous_teams:
-                    players.extend(previous_teams)
-                else:
-                    players.append(player_data)
-        return players
-
 
-class PlayersSkating(Endpoint):
+class PlayersSkating(_SplitTeamsMixin, Endpoint):
     """Fetches and parses skating statistics for Liiga players.
 
     See docs/players_skating.md for detailed documentation and examples.
     """
     
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+    GAMETYPE_OPTIONS = _SUMMED_GAMETYPE_OPTIONS
+    gametype_literal = _SUMMED_GAMETYPE_LITERAL
 
     def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason", summed: bool = True):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         self.summed = summed
         url_str: str = f"players/stats/summed/{start_season}/{end_season}/{gtype}/false?team=&dataType=skatingStats&splitTeams=true"
         super().__init__(endpoint_name="PlayersSkating", url_str=url_str)
 
-    
 
-    def _parse(self) -> list[dict]:
-        players = []
-
-        if self.summed:
-            players.extend(self.response)
-
-        else:
-            for player_data in self.response:
-                previous_teams = player_data.get("previousTeamsForTournament")
-                if previous_teams:
-                    players.extend(previous_teams)
-                else:
-                    players.append(player_data)
-        return players
-
-class PlayersAdvanced(Endpoint):
+class PlayersAdvanced(_SplitTeamsMixin, Endpoint):
     """Fetches and parses advanced statistics for Liiga players.
 
     See docs/players_advanced.md for detailed documentation and examples.
     """
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+    GAMETYPE_OPTIONS = _SUMMED_GAMETYPE_OPTIONS
+    gametype_literal = _SUMMED_GAMETYPE_LITERAL
 
     def __init__(self, start_season: str, end_season, gametype: gametype_literal = "regularseason", summed: bool = True):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         self.summed = summed
         url_str: str = f"players/stats/summed/{start_season}/{end_season}/{gtype}/false?team=&dataType=advancedStats&splitTeams=true"
         super().__init__(endpoint_name="PlayersAdvanced", url_str=url_str)
-
-
-
-    def _parse(self) -> list[dict]:
-        players = []
-
-        if self.summed:
-            players.extend(self.response)
-
-        else:
-            for player_data in self.response:
-                previous_teams = player_data.get("previousTeamsForTournament")
-                if previous_teams:
-                    players.extend(previous_teams)
-                else:
-                    players.append(player_data)
-        return players
@@ -1,47 +1,54 @@
-import functools
-import requests
-import pandas as pd
-import json
-from typing import Optional, Dict, Any, Literal
-from liiga_api.utils import flatten_dict, ResponseParser
+from types import MappingProxyType
+from typing import Literal
+from liiga_api.utils import flatten_dict, ResponseParser, resolve_gametype
 from liiga_api.base import Endpoint
-from liiga_api.exceptions import LiigaAPIError
+
+
+# Gametype options shared by the team endpoints
+_GAMETYPE_OPTIONS = MappingProxyType({
+    "regularseason": "runkosarja",
+    "playoff": "playoffs",
+    "preseason": "valmistavat_ottelut",
+    "playout": "playout",
+    "qualification": "qualifications"
+})
+_GAMETYPE_LITERAL = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
 
 
 # TEAM ENDPOINTS
 
-class TeamsAllTime(Endpoint):
+class _TeamStatsEndpoint(Endpoint):
+    """Team stats from teams/stats, subclasses only set the dataType of the request with DATA_TYPE."""
 
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
+    __slots__ = ("stream",)
 
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
-    def __init__(self, season: str, gametype: gametype_literal, team_id: str = ""):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom=1976&seasonTo=2025&tournament={gtype}&dataType=standings"
-        super().__init__(endpoint_name="TeamsAllTime", url_str=url_str)
+    DATA_TYPE: str = ""
+
+    GAMETYPE_OPTIONS = _GAMETYPE_OPTIONS
+    gametype_literal = _GAMETYPE_LITERAL
+
+    def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason", stream: bool = False):
+        # With stream=True teams are flattened while the response downloads (requires ijson)
+        self.stream = stream
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
+        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType={self.DATA_TYPE}"
+        super().__init__(endpoint_name=self.__class__.__name__, url_str=url_str)
 
     def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
+        teams = self._stream_items("teamStats.item") if self.stream else self._response_field("teamStats")
+        return [flatten_dict(team) for team in teams]
+
+
+class TeamsAllTime(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "standings"
+
+    def __init__(self, season: str, gametype: _GAMETYPE_LITERAL, team_id: str = "", stream: bool = False):
+        super().__init__("1976", "2025", gametype, stream)
 
 
 class TeamsInfo(Endpoint):
+    __slots__ = ()
 
     _COLUMNS = {
     "id": "teamId",
@@ -57,34 +64,25 @@ class TeamsInfo(Endpoint):
     "short_name": "shortName",
     "slug": "slug"
     }
+    _parse_team = staticmethod(ResponseParser._compile_record_parser(_COLUMNS))
 
     def __init__(self):
         url_str: str = f"teams/info"
         super().__init__(endpoint_name="TeamsInfo", url_str=url_str)
 
     def _parse(self) -> list[dict]:
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        r = self.response['teams']
-        data = []
-
-        for team in r.values():
-            data.append(ResponseParser._parse_record(team, self._COLUMNS))
-
-        return data
+        parse_team = self._parse_team
+        return [parse_team(team) for team in self._response_field('teams').values()]
 
 class TeamsStatsPerSeason(Endpoint):
+    __slots__ = ()
 
     def __init__(self):
         url_str: str = f"teams/info"
         super().__init__(endpoint_name="TeamsStatsPerSeason", url_str=url_str)
 
     def _parse(self) -> list[dict]:
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        r = self.response['teams']
+        r = self._response_field('teams')
         data = []
 
         for team in r.values():
@@ -95,20 +93,11 @@ class TeamsStatsPerSeason(Endpoint):
         return data
 
 class TeamsRosters(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+    __slots__ = ()
+    GAMETYPE_OPTIONS = _GAMETYPE_OPTIONS
+    gametype_literal = _GAMETYPE_LITERAL
     def __init__(self, start_season: str, end_season: str, gametype: gametype_literal):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
+        gtype = resolve_gametype(gametype, self.GAMETYPE_OPTIONS)
         url_str: str = f"players/info?tournament={gtype}&fromSeason={start_season}&toSeason={end_season}&team="
         super().__init__(endpoint_name="TeamsRosters", url_str=url_str)
 
@@ -116,291 +105,61 @@ class TeamsRosters(Endpoint):
 
 # Season team stats
 
-class TeamStandings(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
-
-    def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason", team_id: str | None = None):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType=standings"
-        super().__init__(endpoint_name="TeamStandings", url_str=url_str)
-
-    def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
-        
-class TeamShots(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+class TeamStandings(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "standings"
 
-    def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason"):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType=shots"
-        super().__init__(endpoint_name="TeamShots", url_str=url_str)
+    def __init__(self, start_season: str, end_season: str, gametype: _GAMETYPE_LITERAL = "regularseason", team_id: str | None = None, stream: bool = False):
+        super().__init__(start_season, end_season, gametype, stream)
 
-    def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
-
-class TeamPasses(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
-
-    def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason"):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType=passes"
-        super().__init__(endpoint_name="TeamPasses", url_str=url_str)
-
-    def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
-
-class TeamFaceoffs(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
-
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
-
-    def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason"):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType=faceoffs"
-        super().__init__(endpoint_name="TeamFaceoffs", url_str=url_str)
-
-    def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
-
-class TeamEvenStrength(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
 
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+class TeamShots(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "shots"
 
-    def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason"):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType=even_strength"
-        super().__init__(endpoint_name="TeamEvenStrength", url_str=url_str)
 
-    def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
-
-class TeamPenaltyKill(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
+class TeamPasses(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "passes"
 
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
 
-    def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason"):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType=penalty_kill"
-        super().__init__(endpoint_name="TeamPenaltyKill", url_str=url_str)
+class TeamFaceoffs(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "faceoffs"
 
-    def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
-
-class TeamPowerPlay(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
 
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+class TeamEvenStrength(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "even_strength"
 
-    def __init__(self, start_season: str, end_season: str, gametype: gametype_literal = "regularseason"):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType=powerplay"
-        super().__init__(endpoint_name="TeamPowerPlay", url_str=url_str)
 
-    def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
-    
-class TeamPenalties(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
+class TeamPenaltyKill(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "penalty_kill"
 
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
 
-    def __init__(self, start_season: str, end_season: str, gametype: str):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
-        
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType=penalties"
-        super().__init__(endpoint_name="TeamPenalties", url_str=url_str)
+class TeamPowerPlay(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "powerplay"
 
-    def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
-    
-class TeamAttendance(Endpoint):
-    GAMETYPE_OPTIONS = {
-        "regularseason": "runkosarja",
-        "playoff": "playoffs",
-        "preseason": "valmistavat_ottelut",
-        "playout": "playout",
-        "qualification": "qualifications"
-    }
 
-    gametype_literal = Literal["regularseason", "playoff", "preseason", "playout", "qualification"]
+class TeamPenalties(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "penalties"
 
-    def __init__(self, start_season: str, end_season: str, gametype: str):
-        if gametype not in self.GAMETYPE_OPTIONS:
-            raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(self.GAMETYPE_OPTIONS.keys())}")
 
-        gtype = self.GAMETYPE_OPTIONS[gametype]
-        url_str: str = f"teams/stats?seasonFrom={start_season}&seasonTo={end_season}&tournament={gtype}&dataType=attendance"
-        super().__init__(endpoint_name="TeamAttendance", url_str=url_str)
-
-    def _parse(self) -> list[dict]:
-        
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["teamStats"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
-    
+class TeamAttendance(_TeamStatsEndpoint):
+    __slots__ = ()
+    DATA_TYPE = "attendance"
 
 
 # SIMPLE STANDINGS
 
 class Standings(Endpoint):
+    __slots__ = ()
     def __init__(self, season: str):
         url_str: str = f"standings/?season={season}"
         super().__init__(endpoint_name="Standings", url_str=url_str)
 
     def _parse(self) -> list[dict]:
-        if not isinstance(self.response, dict):
-            raise LiigaAPIError(f"Unexpected response type for {self.endpoint_name}: {type(self.response)}")
-        
-        results = []
-        data = self.response["season"]
-        for team in data:
-            results.append(flatten_dict(team))
-        return results
+        return [flatten_dict(team) for team in self._response_field("season")]
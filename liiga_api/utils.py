@@ -1,20 +1,48 @@
+import functools
+from typing import Any, Callable, Mapping
+
 
 class ResponseParser:
     """Helper class to build custom parsers for endpoints."""
 
+    @staticmethod
+    def _compile_record_parser(columns: dict) -> Callable[[Any], dict]:
+        """Generate a function extracting the fields of a COLUMNS spec, missing or non-dict parents give None.
+        Each dotted path is inlined as chained lookups so parsing a record is a single dict literal."""
+        fields = []
+        for path, col in columns.items():
+            *parents, last = path.split(".")
+            # Every intermediate value must be a dict, otherwise the field is None
+            checks = ["isinstance(v := d.get(%r), dict)" % parents[0]] if parents else []
+            checks += ["isinstance(v := v.get(%r), dict)" % key for key in parents[1:]]
+            source = "v" if parents else "d"
+            getter = "%s.get(%r)" % (source, last)
+            fields.append("%r: %s" % (col, f"{getter} if {' and '.join(checks)} else None" if checks else getter))
+        source = (
+            "def parse_record(d):\n"
+            "    if not isinstance(d, dict):\n"
+            "        d = {}\n"
+            "    return {%s}\n" % ", ".join(fields)
+        )
+        namespace = {}
+        exec(source, {"isinstance": isinstance, "dict": dict}, namespace)
+        return namespace["parse_record"]
+
+    @staticmethod
+    def _record_parser(columns: dict) -> Callable[[Any], dict]:
+        """Same as _compile_record_parser, reusing the function already generated for an equal spec."""
+        return _cached_record_parser(tuple(columns.items()))
+
     @staticmethod
     def _parse_record(data: dict, columns: dict) -> dict:
-        """Extract fields according to COLUMNS spec."""
-        return {
-            col: ResponseParser._get_nested(data, path) for path, col in columns.items()
-            }
+        """Extract fields according to COLUMNS spec, through the generated parser for the spec."""
+        return ResponseParser._record_parser(columns)(data)
 
-    
     @staticmethod
-    def _get_nested(data: dict, path: str):
-        """Navigate nested dict using dot notation."""
+    def _get_nested(data: dict, path: str | tuple):
+        """Navigate nested dict using dot notation or a path already split into keys."""
         current = data
-        for key in path.split("."):
+        for key in (path.split(".") if isinstance(path, str) else path):
             if not isinstance(current, dict):
                 return None
             current = current.get(key)
@@ -22,20 +50,47 @@ class ResponseParser:
                 return None
         return current
 
-        
+    @staticmethod
+    def _select_columns(columns: dict, names: list) -> dict:
+        """Restricts a COLUMNS spec to the given output column names."""
+        unknown = set(names) - set(columns.values())
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}. Choose from {list(columns.values())}")
+        return {path: col for path, col in columns.items() if col in names}
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_record_parser(items: tuple) -> Callable[[Any], dict]:
+    return ResponseParser._compile_record_parser(dict(items))
+
+
+def flatten_dict(d, parent_key="", skip_keys=None): # Flattening for endpoint json responses!!
+    """Lifts the leaves of nested dicts to the top level under their own key, a later leaf with the same key wins.
+    Uses a stack of item iterators instead of recursion, keys in skip_keys are kept as is."""
+    skip_keys = frozenset(skip_keys or ())
+    out = {}
+    stack = [iter(d.items())]
+    while stack:
+        for k, v in stack[-1]:
+            if k in skip_keys:
+                out[k] = v
+            elif isinstance(v, dict):
+                # Descend now, the parent iterator resumes after the nested dict is done
+                stack.append(iter(v.items()))
+                break
+            else:
+                out[k] = v
+        else:
+            stack.pop()
+    return out
 
 
-def flatten_dict(d, parent_key="", skip_keys=None): # Recusive flattening for endpoint json responses!!
-            skip_keys = skip_keys or []
-            out = {}
-            for k, v in d.items():
-                if k in skip_keys:
-                    out[k] = v
-                elif isinstance(v, dict):
-                    out.update(flatten_dict(v, parent_key=f"{parent_key}{k}_", skip_keys=skip_keys))
-                else:
-                    out[k] = v
-            return out
+def resolve_gametype(gametype: str, options: Mapping[str, str]) -> str:
+    """Maps a gametype option to the value used by the API, raises ValueError for unknown options."""
+    try:
+        return options[gametype]
+    except KeyError:
+        raise ValueError(f"Invalid gametype: {gametype}. Choose one of {list(options)}") from None
 
 
 def search_playerid_by_name(name: str):